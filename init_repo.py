@@ -14,16 +14,291 @@ Author: Your Name
 Date: 2025
 """
 
-import argparse
+import atexit
+import concurrent.futures
+import functools
+import importlib.util
 import json
 import logging
 import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Tuple
 
-import requests
+# requests pulls in urllib3, ssl and friends, so it's only imported once an
+# HTTP session is actually needed
+if TYPE_CHECKING:
+    import requests
+
+_HOME = os.path.expanduser("~")
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Directories searched for the config file, in priority order
+_CONFIG_SEARCH_DIRS = (
+    ".",  # Current directory
+    _SCRIPT_DIR,  # Same dir as script
+    os.path.join(_HOME, ".config", "init_repo"),  # User config dir
+    _HOME  # Home directory
+)
+
+# Keys every config file must define
+_REQUIRED_KEYS: FrozenSet[str] = frozenset({'github_token', 'github_username', 'ssh_alias'})
+
+# Seconds to wait for the initial push before giving up. Only applied when
+# stdin isn't a terminal, so interactive ssh prompts are never cut off.
+_PUSH_TIMEOUT = 120
+
+# Cached GitHub /user response, revalidated with its ETag by the test suite
+_USER_CACHE_PATH = os.path.join(_HOME, ".cache", "init_repo", "user_etag.json")
+
+# Contents of the .gitignore created in new repositories
+_GITIGNORE_BYTES: bytes = b"""# macOS
+.DS_Store
+.AppleDouble
+.LSOverride
+
+# Node.js
+node_modules/
+npm-debug.log*
+yarn-debug.log*
+yarn-error.log*
+
+# Python
+__pycache__/
+*.py[cod]
+*.pyo
+*.pyd
+.Python
+env/
+venv/
+ENV/
+
+# VSCode
+.vscode/
+
+# JetBrains IDEs
+.idea/
+*.iml
+
+# Logs
+logs/
+*.log
+
+# Environment files
+.env
+.env.*
+
+# Build output
+dist/
+build/
+
+# Misc
+*.swp
+*~ 
+"""
+
+
+def _config_search_paths(config_path: str) -> List[str]:
+    """
+    Build the list of locations searched for the config file, in priority order.
+    
+    Args:
+        config_path (str): Config file path as given on the command line
+        
+    Returns:
+        List[str]: Candidate paths
+    """
+    return [
+        os.path.join(directory, config_path) if directory != "." else config_path
+        for directory in _CONFIG_SEARCH_DIRS
+    ]
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_config_path(config_path: str, cwd: str) -> Optional[str]:
+    """
+    Locate the config file, caching the result for the life of the process.
+    
+    Callers must clear the cache after a miss so a config created later is
+    still found.
+    
+    Args:
+        config_path (str): Config file path as given on the command line
+        cwd (str): Current working directory, so relative paths are keyed per directory
+        
+    Returns:
+        Optional[str]: Absolute path of the first match, or None if not found
+    """
+    for path in _config_search_paths(config_path):
+        if os.path.exists(path):
+            return os.path.abspath(path)
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _create_sample_config() -> None:
+    """Create a sample configuration file, at most once per process."""
+    logger = logging.getLogger(__name__)
+    
+    # Create config in the same directory as the script
+    config_path = os.path.join(_SCRIPT_DIR, "config.json")
+    
+    sample_config = {
+        "github_token": "your_github_personal_access_token_here",
+        "github_username": "YourGitHubUsername",
+        "ssh_alias": "github-alias",
+        "default_branch": "main"
+    }
+    
+    try:
+        # Never overwrite an existing config, e.g. when a custom --config was missed
+        with open(config_path, 'x') as f:
+            json.dump(sample_config, f, indent=2)
+            
+        logger.info(f"Created sample config file: {config_path}")
+        logger.info("Please edit the config file with your actual values")
+    except FileExistsError:
+        logger.info(f"Leaving existing config file untouched: {config_path}")
+    except Exception as e:
+        logger.error(f"Failed to create sample config: {e}")
+        print(f"Please create a config.json file manually with your settings")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(abs_path: str) -> Dict:
+    """
+    Parse and validate a config file, caching the result per absolute path.
+    
+    Args:
+        abs_path (str): Absolute path of the config file
+        
+    Returns:
+        Dict: Configuration dictionary
+        
+    Raises:
+        ValueError: If required keys are missing
+        json.JSONDecodeError: If config file is invalid JSON
+    """
+    # Read the file in one go and parse the bytes directly, using orjson
+    # when it's installed
+    data = Path(abs_path).read_bytes()
+    try:
+        import orjson
+        config = orjson.loads(data)
+    except ImportError:
+        config = json.loads(data)
+        
+    # Validate required configuration keys
+    missing_keys = _REQUIRED_KEYS.difference(config)
+    
+    if missing_keys:
+        raise ValueError(f"Missing required config keys: {sorted(missing_keys)}")
+        
+    return config
+
+
+def _read_user_cache() -> Dict:
+    """
+    Read the cached GitHub /user response.
+    
+    Returns:
+        Dict: Cache with 'etag' and 'login' keys, empty if there is none
+    """
+    try:
+        with open(_USER_CACHE_PATH, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_user_cache(etag: str, login: str) -> None:
+    """
+    Cache the ETag and login of a GitHub /user response for conditional requests.
+    
+    Only the login is kept, since the full response includes private account
+    details, and the file is readable by the owner only.
+    
+    Args:
+        etag (str): ETag header of the response
+        login (str): Login of the authenticated user
+    """
+    try:
+        os.makedirs(os.path.dirname(_USER_CACHE_PATH), exist_ok=True)
+        fd = os.open(_USER_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)  # Tighten a file left over from an older version
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"etag": etag, "login": login}, f)
+    except OSError as e:
+        logging.getLogger(__name__).debug(f"Failed to write user cache: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def _setup_logging_once() -> None:
+    """Configure logging for the application, once per process."""
+    # logging.handlers pulls in socket, pickle and queue, so keep it off the
+    # import path of runs that never set up logging, like --help
+    import logging.handlers
+    
+    log_format = '%(asctime)s - %(levelname)s - %(message)s'
+    
+    # Buffer file records and write them out in one go; errors and
+    # interpreter exit flush the buffer immediately
+    log_file = logging.handlers.RotatingFileHandler(
+        'init_repo.log', maxBytes=1_000_000, backupCount=3, delay=True
+    )
+    log_file.setFormatter(logging.Formatter(log_format))
+    file_handler = logging.handlers.MemoryHandler(
+        capacity=128, flushLevel=logging.ERROR, target=log_file
+    )
+    atexit.register(file_handler.flush)
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format=log_format,
+        handlers=[
+            logging.StreamHandler(),
+            file_handler
+        ]
+    )
+
+
+def _decode_output(output: Optional[bytes]) -> str:
+    """
+    Decode captured subprocess output.
+    
+    Args:
+        output (Optional[bytes]): Raw output, or None if it wasn't captured
+        
+    Returns:
+        str: Decoded and stripped output
+    """
+    if not output:
+        return ""
+    return output.decode('utf-8', 'replace').strip()
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file, creating or truncating it.
+    
+    Args:
+        path (str): File path
+        data (bytes): File contents
+    """
+    # 0o666 is masked by the umask, matching open()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        # os.write may write only part of the buffer, so keep going until
+        # everything is on disk
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
 
 class RepoInitializer:
@@ -37,20 +312,10 @@ class RepoInitializer:
             config_path (str): Path to configuration file
         """
         self.config_path = config_path
-        self._setup_logging()  # Set up logging FIRST
-        self.config = self._load_config()
-        
-    def _setup_logging(self) -> None:
-        """Configure logging for the application."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler('init_repo.log')
-            ]
-        )
+        _setup_logging_once()  # Set up logging FIRST
         self.logger = logging.getLogger(__name__)
+        self.config = self._load_config()
+        self._session: Optional['requests.Session'] = None
         
     def _load_config(self) -> Dict:
         """
@@ -63,105 +328,117 @@ class RepoInitializer:
             FileNotFoundError: If config file doesn't exist
             json.JSONDecodeError: If config file is invalid JSON
         """
-        # Try to find config file in multiple locations
-        possible_paths = [
-            self.config_path,  # Provided path or default "config.json"
-            os.path.join(os.path.dirname(__file__), self.config_path),  # Same dir as script
-            os.path.join(os.path.expanduser("~"), ".config", "init_repo", self.config_path),  # User config dir
-            os.path.join(os.path.expanduser("~"), self.config_path)  # Home directory
-        ]
+        config_file_path = _resolve_config_path(self.config_path, os.getcwd())
         
-        config_file_path = None
-        for path in possible_paths:
-            if os.path.exists(path):
-                config_file_path = path
-                self.logger.info(f"Found config file at: {path}")
-                break
-                
         if not config_file_path:
+            # Don't remember the miss, so a config created later is picked up
+            _resolve_config_path.cache_clear()
             self.logger.error(f"Config file not found. Searched in:")
-            for path in possible_paths:
+            for path in _config_search_paths(self.config_path):
                 self.logger.error(f"  - {path}")
-            self._create_sample_config()
+            _create_sample_config()
             raise FileNotFoundError(f"Config file '{self.config_path}' not found")
+            
+        self.logger.info(f"Found config file at: {config_file_path}")
         
         try:
-            with open(config_file_path, 'r') as f:
-                config = json.load(f)
-                
-            # Validate required configuration keys
-            required_keys = ['github_token', 'github_username', 'ssh_alias']
-            missing_keys = [key for key in required_keys if key not in config]
-            
-            if missing_keys:
-                raise ValueError(f"Missing required config keys: {missing_keys}")
-                
-            return config
+            # Copy so callers can't mutate the cached configuration
+            return dict(_load_config_cached(config_file_path))
             
         except json.JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in config file: {e}")
             raise
             
-    def _create_sample_config(self) -> None:
-        """Create a sample configuration file."""
-        # Create config in the same directory as the script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        config_path = os.path.join(script_dir, "config.json")
-        
-        sample_config = {
-            "github_token": "your_github_personal_access_token_here",
-            "github_username": "YourGitHubUsername",
-            "ssh_alias": "github-alias",
-            "default_branch": "main"
-        }
+    @property
+    def session(self) -> 'requests.Session':
+        """Pooled HTTP session for GitHub API calls, created on first use."""
+        if self._session is None:
+            self._session = self._create_session()
+        return self._session
         
-        try:
-            with open(config_path, 'w') as f:
-                json.dump(sample_config, f, indent=2)
-                
-            self.logger.info(f"Created sample config file: {config_path}")
-            self.logger.info("Please edit the config file with your actual values")
-        except Exception as e:
-            self.logger.error(f"Failed to create sample config: {e}")
-            print(f"Please create a config.json file manually with your settings")
+    def _create_session(self) -> 'requests.Session':
+        """
+        Create a pooled HTTP session for GitHub API calls.
         
-    def _run_command(self, command: str, cwd: Optional[str] = None, 
-                    check: bool = True) -> Tuple[bool, str, str]:
+        Returns:
+            requests.Session: Session with GitHub auth headers and retries configured
         """
-        Execute a shell command.
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.headers.update({
+            "Authorization": f"token {self.config['github_token']}",
+            "Accept": "application/vnd.github.v3+json"
+        })
+        
+        # Retry transient failures with backoff, honouring Retry-After. Only
+        # idempotent requests are retried; repository creation is a POST and
+        # is deduplicated by the HEAD check in create_github_repo instead
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True
+        )
+        session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+        
+        return session
+        
+    def _run_command(self, command: List[str], cwd: Optional[str] = None, 
+                    check: bool = True, capture: bool = False,
+                    timeout: Optional[float] = None) -> Tuple[bool, str, str]:
+        """
+        Execute a command directly, without going through a shell.
         
         Args:
-            command (str): Command to execute
+            command (List[str]): Command and its arguments
             cwd (Optional[str]): Working directory
             check (bool): Whether to raise exception on non-zero exit
+            capture (bool): Whether to capture stdout; when False it is discarded
+            timeout (Optional[float]): Seconds before the command is killed, None to wait indefinitely
             
         Returns:
             Tuple[bool, str, str]: (success, stdout, stderr)
         """
-        self.logger.debug(f"Running command: {command}")
+        self.logger.debug(f"Running command: {' '.join(command)}")
+        
+        # Most steps only need stderr for error reporting, so skip buffering
+        # and decoding stdout unless the caller asks for it
+        if capture:
+            output_options = {'stdout': subprocess.PIPE, 'stderr': subprocess.PIPE}
+        else:
+            output_options = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE}
         
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                check=check
-            )
-            
-            self.logger.debug(f"Command output: {result.stdout}")
-            if result.stderr:
-                self.logger.debug(f"Command stderr: {result.stderr}")
+            result = subprocess.run(command, cwd=cwd, check=check, timeout=timeout, **output_options)
+            stdout = _decode_output(result.stdout)
+            stderr = _decode_output(result.stderr)
+            
+            if capture:
+                self.logger.debug(f"Command output: {stdout}")
+            if stderr:
+                self.logger.debug(f"Command stderr: {stderr}")
                 
-            return True, result.stdout.strip(), result.stderr.strip()
-            
+            return True, stdout, stderr
+            
+        except FileNotFoundError as e:
+            self.logger.error(f"Command not found: {command[0]}")
+            return False, "", str(e)
+        except subprocess.TimeoutExpired as e:
+            self.logger.error(f"Command timed out after {timeout} seconds: {' '.join(command)}")
+            return False, _decode_output(e.stdout), _decode_output(e.stderr)
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Command failed: {command}")
+            stdout = _decode_output(e.stdout)
+            stderr = _decode_output(e.stderr)
+            self.logger.error(f"Command failed: {' '.join(command)}")
             self.logger.error(f"Exit code: {e.returncode}")
-            self.logger.error(f"Stdout: {e.stdout}")
-            self.logger.error(f"Stderr: {e.stderr}")
-            return False, e.stdout.strip() if e.stdout else "", e.stderr.strip() if e.stderr else ""
+            if capture:
+                self.logger.error(f"Stdout: {stdout}")
+            self.logger.error(f"Stderr: {stderr}")
+            return False, stdout, stderr
             
     def create_github_repo(self, repo_name: str) -> bool:
         """
@@ -173,14 +450,11 @@ class RepoInitializer:
         Returns:
             bool: True if successful, False otherwise
         """
+        import requests
+        
         self.logger.info(f"Creating GitHub repository: {repo_name}")
         
         url = "https://api.github.com/user/repos"
-        headers = {
-            "Authorization": f"token {self.config['github_token']}",
-            "Accept": "application/vnd.github.v3+json",
-            "Content-Type": "application/json"
-        }
         
         data = {
             "name": repo_name,
@@ -190,7 +464,17 @@ class RepoInitializer:
         }
         
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=30)
+            # A HEAD request is cheap and non-mutating, so check for an existing
+            # repository first rather than relying on the POST failing
+            existing = self.session.head(
+                f"https://api.github.com/repos/{self.config['github_username']}/{repo_name}",
+                timeout=5
+            )
+            if existing.status_code == 200:
+                self.logger.warning(f"Repository {repo_name} already exists on GitHub")
+                return True  # Consider this a success for our purposes
+                
+            response = self.session.post(url, json=data, timeout=30)
             
             if response.status_code == 201:
                 self.logger.info(f"Successfully created GitHub repository: {repo_name}")
@@ -229,54 +513,48 @@ class RepoInitializer:
             self.logger.error(f"Directory {repo_name} already exists")
             return False
             
-        # Create directory and navigate to it
-        success, _, _ = self._run_command(f"mkdir {repo_name}")
-        if not success:
+        # Create directory
+        try:
+            Path(repo_name).mkdir()
+        except OSError as e:
+            self.logger.error(f"Failed to create directory {repo_name}: {e}")
             return False
             
         # Create README.md
-        readme_content = f"# {repo_name}\n"
         readme_path = os.path.join(repo_name, "README.md")
         
         try:
-            with open(readme_path, 'w') as f:
-                f.write(readme_content)
+            _write_file(readme_path, f"# {repo_name}\n".encode())
         except IOError as e:
             self.logger.error(f"Failed to create README.md: {e}")
             return False
             
-        # Initialize git repository
-        success, _, _ = self._run_command("git init", cwd=repo_name)
-        if not success:
-            return False
-            
         # Create .gitignore file
         if not self._create_gitignore(repo_name):
             return False
             
-        # Add files and make initial commit
-        success, _, _ = self._run_command("git add .", cwd=repo_name)
-        if not success:
-            return False
-            
-        success, _, _ = self._run_command('git commit -m "first commit"', cwd=repo_name)
-        if not success:
-            return False
-            
-        # Set default branch
         default_branch = self.config.get('default_branch', 'main')
-        success, _, _ = self._run_command(f"git branch -M {default_branch}", cwd=repo_name)
-        if not success:
-            return False
-            
-        # Add remote origin
         remote_url = f"git@{self.config['ssh_alias']}:{self.config['github_username']}/{repo_name}.git"
-        success, _, _ = self._run_command(f"git remote add origin {remote_url}", cwd=repo_name)
+        
+        # Initialize git repository, make initial commit and add remote origin.
+        # pygit2 is optional and loads libgit2, so it's only imported when used.
+        if importlib.util.find_spec("pygit2") is not None:
+            success = self._init_git_in_process(repo_name, default_branch, remote_url)
+        else:
+            success = self._init_git_with_cli(repo_name, default_branch, remote_url)
         if not success:
             return False
             
-        # Push to remote
-        success, _, _ = self._run_command(f"git push -u origin {default_branch}", cwd=repo_name)
+        # Push to remote. This always goes through the git executable, since
+        # libgit2 does not honour the Host aliases in ~/.ssh/config. When
+        # attached to a terminal ssh may be waiting on a passphrase or host-key
+        # prompt, so the push is only time-limited in non-interactive runs.
+        self.logger.info(f"Pushing {default_branch} to origin...")
+        timeout = None if sys.stdin.isatty() else _PUSH_TIMEOUT
+        success, _, _ = self._run_command(
+            ["git", "-C", repo_name, "push", "-u", "origin", default_branch],
+            timeout=timeout
+        )
         if not success:
             self.logger.error("Failed to push to remote. Check your SSH configuration.")
             return False
@@ -284,6 +562,63 @@ class RepoInitializer:
         self.logger.info(f"Successfully set up local repository: {repo_name}")
         return True
         
+    def _init_git_in_process(self, repo_name: str, default_branch: str, 
+                             remote_url: str) -> bool:
+        """
+        Initialize the repository, commit and add the remote using pygit2.
+        
+        Args:
+            repo_name (str): Name of the repository
+            default_branch (str): Branch the initial commit is made on
+            remote_url (str): URL of the origin remote
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        import pygit2
+        
+        try:
+            repo = pygit2.init_repository(repo_name, initial_head=default_branch)
+            repo.index.add_all()
+            repo.index.write()
+            tree = repo.index.write_tree()
+            signature = repo.default_signature
+            repo.create_commit('HEAD', signature, signature, "first commit", tree, [])
+            repo.remotes.create('origin', remote_url)
+            self.logger.debug("Initialized repository with pygit2")
+            return True
+        except (pygit2.GitError, KeyError, ValueError, OSError) as e:
+            self.logger.error(f"Failed to initialize git repository: {e}")
+            return False
+            
+    def _init_git_with_cli(self, repo_name: str, default_branch: str, 
+                           remote_url: str) -> bool:
+        """
+        Initialize the repository, commit and add the remote using the git executable.
+        
+        Args:
+            repo_name (str): Name of the repository
+            default_branch (str): Branch the initial commit is made on
+            remote_url (str): URL of the origin remote
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        commands = [
+            ["git", "-C", repo_name, "init"],
+            ["git", "-C", repo_name, "add", "."],
+            ["git", "-C", repo_name, "commit", "-m", "first commit"],
+            ["git", "-C", repo_name, "branch", "-M", default_branch],
+            ["git", "-C", repo_name, "remote", "add", "origin", remote_url],
+        ]
+        
+        for command in commands:
+            success, _, _ = self._run_command(command)
+            if not success:
+                return False
+                
+        return True
+        
     def _create_gitignore(self, repo_name: str) -> bool:
         """
         Create .gitignore file with common patterns.
@@ -294,56 +629,10 @@ class RepoInitializer:
         Returns:
             bool: True if successful, False otherwise
         """
-        gitignore_content = """# macOS
-.DS_Store
-.AppleDouble
-.LSOverride
-
-# Node.js
-node_modules/
-npm-debug.log*
-yarn-debug.log*
-yarn-error.log*
-
-# Python
-__pycache__/
-*.py[cod]
-*.pyo
-*.pyd
-.Python
-env/
-venv/
-ENV/
-
-# VSCode
-.vscode/
-
-# JetBrains IDEs
-.idea/
-*.iml
-
-# Logs
-logs/
-*.log
-
-# Environment files
-.env
-.env.*
-
-# Build output
-dist/
-build/
-
-# Misc
-*.swp
-*~ 
-"""
-        
         gitignore_path = os.path.join(repo_name, ".gitignore")
         
         try:
-            with open(gitignore_path, 'w') as f:
-                f.write(gitignore_content)
+            _write_file(gitignore_path, _GITIGNORE_BYTES)
             self.logger.debug("Created .gitignore file")
             return True
         except IOError as e:
@@ -374,6 +663,23 @@ build/
         return True
 
 
+@functools.lru_cache(maxsize=4)
+def get_initializer(config_path: str = "config.json") -> RepoInitializer:
+    """
+    Get a shared RepoInitializer for a config file.
+    
+    Reusing the instance avoids reloading the config and lets repeated
+    repository creations share one HTTP session.
+    
+    Args:
+        config_path (str): Path to configuration file
+        
+    Returns:
+        RepoInitializer: Initializer for the given config file
+    """
+    return RepoInitializer(config_path=config_path)
+
+
 class TestSuite:
     """Test suite for the RepoInitializer."""
     
@@ -389,15 +695,14 @@ class TestSuite:
         
     def test_config_loading(self) -> bool:
         """Test configuration loading."""
-        self.logger.info("Testing configuration loading...")
+        self.logger.info("[test_config_loading] Testing configuration loading...")
         
         try:
             # Test if config is loaded properly
-            required_keys = ['github_token', 'github_username', 'ssh_alias']
-            missing_keys = [key for key in required_keys if key not in self.initializer.config]
+            missing_keys = _REQUIRED_KEYS.difference(self.initializer.config)
             
             if missing_keys:
-                self.logger.error(f"Missing config keys: {missing_keys}")
+                self.logger.error(f"Missing config keys: {sorted(missing_keys)}")
                 return False
                 
             # Test if values are not default/placeholder values
@@ -414,20 +719,29 @@ class TestSuite:
             
     def test_github_api_connection(self) -> bool:
         """Test GitHub API connection."""
-        self.logger.info("Testing GitHub API connection...")
+        self.logger.info("[test_github_api_connection] Testing GitHub API connection...")
         
         try:
             url = "https://api.github.com/user"
-            headers = {
-                "Authorization": f"token {self.initializer.config['github_token']}",
-                "Accept": "application/vnd.github.v3+json"
-            }
             
-            response = requests.get(url, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                user_data = response.json()
-                username = user_data.get('login')
+            # Revalidate the cached response instead of refetching it; a 304
+            # carries no body and doesn't count against the rate limit
+            cache = _read_user_cache()
+            headers = {}
+            if cache.get('etag') and 'login' in cache:
+                headers['If-None-Match'] = cache['etag']
+                
+            response = self.initializer.session.get(url, headers=headers, timeout=10)
+            
+            if response.status_code == 304:
+                username = cache['login']
+            elif response.status_code == 200:
+                username = response.json().get('login')
+                etag = response.headers.get('ETag')
+                if etag:
+                    _write_user_cache(etag, username)
+                    
+            if response.status_code in (200, 304):
                 self.logger.info(f"✓ GitHub API connection test passed (User: {username})")
                 
                 # Verify username matches config
@@ -445,9 +759,9 @@ class TestSuite:
             
     def test_git_availability(self) -> bool:
         """Test if git is available in the system."""
-        self.logger.info("Testing git availability...")
+        self.logger.info("[test_git_availability] Testing git availability...")
         
-        success, stdout, stderr = self.initializer._run_command("git --version", check=False)
+        success, stdout, stderr = self.initializer._run_command(["git", "--version"], check=False, capture=True)
         
         if success and "git version" in stdout.lower():
             self.logger.info(f"✓ Git availability test passed ({stdout})")
@@ -458,14 +772,15 @@ class TestSuite:
             
     def test_ssh_configuration(self) -> bool:
         """Test SSH configuration for GitHub."""
-        self.logger.info("Testing SSH configuration...")
+        self.logger.info("[test_ssh_configuration] Testing SSH configuration...")
         
         ssh_alias = self.initializer.config['ssh_alias']
         
         # Test SSH connection (this will likely fail but we can check the error type)
         success, stdout, stderr = self.initializer._run_command(
-            f"ssh -T git@{ssh_alias}", 
-            check=False
+            ["ssh", "-T", f"git@{ssh_alias}"],
+            check=False,
+            capture=True
         )
         
         # GitHub SSH test returns exit code 1 even on success
@@ -500,15 +815,18 @@ class TestSuite:
             self.test_ssh_configuration
         ]
         
+        # The tests are independent and mostly wait on the network or
+        # subprocesses, so run them concurrently
         results = []
-        for test in tests:
-            try:
-                result = test()
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"Test {test.__name__} failed with exception: {e}")
-                results.append(False)
-                
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            futures = {executor.submit(test): test for test in tests}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    self.logger.error(f"Test {futures[future].__name__} failed with exception: {e}")
+                    results.append(False)
+                    
         passed = sum(results)
         total = len(results)
         
@@ -522,44 +840,107 @@ class TestSuite:
             return False
 
 
-def main():
-    """Main function to handle command line arguments and execution."""
-    parser = argparse.ArgumentParser(
-        description="Initialize a new GitHub repository with local git setup",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_USAGE = "usage: {prog} [-h] [--test] [--config CONFIG] [--verbose] [repo_name]"
+
+_HELP = _USAGE + """
+
+Initialize a new GitHub repository with local git setup
+
+positional arguments:
+  repo_name        Name of the repository to create
+
+options:
+  -h, --help       show this help message and exit
+  --test           Run the test suite
+  --config CONFIG  Path to configuration file (default: config.json)
+  --verbose, -v    Enable verbose logging
+
 Examples:
   python3 init_repo.py my_new_project     # Create repository 'my_new_project'
   python3 init_repo.py --test             # Run test suite
   python3 init_repo.py --help             # Show this help message
-        """
-    )
-    
-    parser.add_argument(
-        'repo_name',
-        nargs='?',
-        help='Name of the repository to create'
-    )
-    
-    parser.add_argument(
-        '--test',
-        action='store_true',
-        help='Run the test suite'
-    )
+"""
+
+
+_LONG_OPTIONS = ('--help', '--test', '--config', '--verbose')
+
+
+def _parse_args(argv: List[str]) -> SimpleNamespace:
+    """
+    Parse command line arguments.
     
-    parser.add_argument(
-        '--config',
-        default='config.json',
-        help='Path to configuration file (default: config.json)'
-    )
+    The CLI is small enough that a hand-rolled parser avoids the cost of
+    importing and building an argparse parser on every run.
     
-    parser.add_argument(
-        '--verbose', '-v',
-        action='store_true',
-        help='Enable verbose logging'
-    )
+    Args:
+        argv (List[str]): Arguments, excluding the program name
+        
+    Returns:
+        SimpleNamespace: Parsed arguments (repo_name, test, config, verbose)
+    """
+    prog = os.path.basename(sys.argv[0])
+    args = SimpleNamespace(repo_name=None, test=False, config='config.json', verbose=False)
     
-    args = parser.parse_args()
+    def error(message: str) -> None:
+        print(_USAGE.format(prog=prog), file=sys.stderr)
+        print(f"{prog}: error: {message}", file=sys.stderr)
+        sys.exit(2)
+        
+    def expand(option: str) -> str:
+        # Accept unambiguous prefixes of long options, as argparse does
+        if option in _LONG_OPTIONS:
+            return option
+        matches = [name for name in _LONG_OPTIONS if name.startswith(option)]
+        if len(matches) > 1:
+            error(f"ambiguous option: {option} could match {', '.join(matches)}")
+        if not matches:
+            error(f"unrecognized arguments: {option}")
+        return matches[0]
+        
+    remaining = iter(argv)
+    positional_only = False
+    for arg in remaining:
+        if positional_only or not arg.startswith('-') or arg == '-':
+            if args.repo_name is not None:
+                error(f"unrecognized arguments: {arg}")
+            args.repo_name = arg
+        elif arg == '--':
+            positional_only = True
+        elif arg.startswith('--'):
+            option, has_value, value = arg.partition('=')
+            option = expand(option)
+            if option == '--config':
+                if not has_value:
+                    value = next(remaining, None)
+                    if value is None or (value.startswith('-') and value != '-'):
+                        error("argument --config: expected one argument")
+                args.config = value
+            elif has_value:
+                error(f"argument {option}: ignored explicit argument '{value}'")
+            elif option == '--help':
+                print(_HELP.format(prog=prog), end='')
+                sys.exit(0)
+            elif option == '--test':
+                args.test = True
+            else:
+                args.verbose = True
+        else:
+            # Short flags, which may be grouped, e.g. -vh
+            for flag in arg[1:]:
+                if flag == 'h':
+                    print(_HELP.format(prog=prog), end='')
+                    sys.exit(0)
+                elif flag == 'v':
+                    args.verbose = True
+                else:
+                    error(f"unrecognized arguments: {arg}")
+                    
+    return args
+
+
+def main():
+    """Main function to handle command line arguments and execution."""
+    args = _parse_args(sys.argv[1:])
     
     # Set up logging level
     if args.verbose:
@@ -567,7 +948,7 @@ Examples:
         
     try:
         # Initialize the repo initializer
-        initializer = RepoInitializer(config_path=args.config)
+        initializer = get_initializer(args.config)
         
         if args.test:
             # Run test suite
@@ -590,7 +971,7 @@ Examples:
             sys.exit(0 if success else 1)
             
         else:
-            parser.print_help()
+            print(_HELP.format(prog=os.path.basename(sys.argv[0])), end='')
             sys.exit(1)
             
     except KeyboardInterrupt: